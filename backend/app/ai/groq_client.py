@@ -1,28 +1,46 @@
 """
 GROQ AI Client
 """
-from typing import List, Optional
-from groq import Groq
+import asyncio
+import time
+from typing import AsyncIterator, List, Optional
+from app.ai.model_router import ModelRouter
 from app.core.config import settings
 
+NOT_CONFIGURED_MESSAGE = "AI service is not configured. Please add your GROQ API key."
+
+# Attempts per message, each on the next candidate model
+MAX_ATTEMPTS = 2
+
 
 class GroqClient:
     def __init__(self):
         self.client = None
         if settings.GROQ_API_KEY:
-            self.client = Groq(api_key=settings.GROQ_API_KEY)
-        self.model = "llama3-8b-8192"  # GROQ free tier model
+            # Imported here: the SDK is heavy and only needed once configured
+            from groq import Groq
 
-    async def chat(
+            # Retries are done across models by the router, so the SDK must
+            # not retry (or wait 60s) on the same one first
+            self.client = Groq(
+                api_key=settings.GROQ_API_KEY,
+                base_url=settings.GROQ_BASE_URL or None,
+                max_retries=0,
+            )
+        self.router = ModelRouter()
+
+    async def warmup(self) -> None:
+        """Open the upstream connection pool before the first real request"""
+        if not self.client:
+            return
+        await asyncio.to_thread(self.client.models.list)
+
+    def _build_messages(
         self,
         message: str,
         system_prompt: str,
         context: Optional[List[dict]] = None,
-    ) -> str:
-        """Send a message to GROQ and get a response"""
-        if not self.client:
-            return "AI service is not configured. Please add your GROQ API key."
-
+    ) -> List[dict]:
         messages = [{"role": "system", "content": system_prompt}]
 
         # Add context
@@ -32,14 +50,100 @@ class GroqClient:
 
         # Add current message
         messages.append({"role": "user", "content": message})
+        return messages
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1024,
-            )
+    async def chat(
+        self,
+        message: str,
+        system_prompt: str,
+        context: Optional[List[dict]] = None,
+        risk_level: str = "low",
+    ) -> str:
+        """Send a message to GROQ and get a response"""
+        if not self.client:
+            return NOT_CONFIGURED_MESSAGE
+
+        messages = self._build_messages(message, system_prompt, context)
+        decision = self.router.route(message, risk_level)
+
+        error = None
+        for model in decision.candidates[:MAX_ATTEMPTS]:
+            started = time.perf_counter()
+            try:
+                response = await asyncio.to_thread(
+                    self.client.chat.completions.create,
+                    model=model,
+                    messages=messages,
+                    temperature=decision.temperature,
+                    max_tokens=decision.max_tokens,
+                    timeout=self.router.timeout_for(model),
+                )
+            except Exception as e:
+                self.router.record(model, _elapsed_ms(started), ok=False)
+                error = e
+                continue
+            self.router.record(model, _elapsed_ms(started), ok=True)
             return response.choices[0].message.content
-        except Exception as e:
-            return f"I'm having trouble responding right now. Please try again. Error: {str(e)}"
+
+        return f"I'm having trouble responding right now. Please try again. Error: {str(error)}"
+
+    async def stream_chat(
+        self,
+        message: str,
+        system_prompt: str,
+        context: Optional[List[dict]] = None,
+        risk_level: str = "low",
+    ) -> AsyncIterator[str]:
+        """Send a message to GROQ and yield the response as it is generated"""
+        if not self.client:
+            yield NOT_CONFIGURED_MESSAGE
+            return
+
+        messages = self._build_messages(message, system_prompt, context)
+        decision = self.router.route(message, risk_level, stream=True)
+
+        error = None
+        for model in decision.candidates[:MAX_ATTEMPTS]:
+            started = time.perf_counter()
+            # Streams are judged on time to first token, in their own window
+            first_token_ms = None
+            try:
+                stream = await asyncio.to_thread(
+                    self.client.chat.completions.create,
+                    model=model,
+                    messages=messages,
+                    temperature=decision.temperature,
+                    max_tokens=decision.max_tokens,
+                    stream=True,
+                    timeout=self.router.timeout_for(model, stream=True),
+                )
+                # The SDK stream is blocking, so pull each chunk off the event loop
+                chunks = iter(stream)
+                while True:
+                    chunk = await asyncio.to_thread(next, chunks, None)
+                    if chunk is None:
+                        break
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        if first_token_ms is None:
+                            first_token_ms = _elapsed_ms(started)
+                        yield delta
+            except Exception as e:
+                self.router.record(
+                    model, first_token_ms or _elapsed_ms(started), ok=False, stream=True
+                )
+                error = e
+                if first_token_ms is not None:
+                    # Part of the reply is already out, so don't restart it
+                    break
+                continue
+            self.router.record(
+                model, first_token_ms or _elapsed_ms(started), ok=True, stream=True
+            )
+            return
+
+        yield f"I'm having trouble responding right now. Please try again. Error: {str(error)}"
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
@@ -0,0 +1,223 @@
+"""
+Model Router for GROQ requests
+
+Chooses a model and generation limits per message from its length, risk level
+and the live latency/error statistics of each model, failing over when a
+model breaches its latency SLO.
+
+Completions and streams are tracked separately: a completion is timed until
+the whole reply arrives, a stream until its first token, and each is held to
+its own SLO.
+"""
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Messages at or below this length are treated as quick check-ins
+SHORT_MESSAGE_CHARS = 160
+
+STATS_WINDOW_SECONDS = 300
+STATS_MAX_SAMPLES = 200
+MIN_SAMPLES = 5
+MAX_ERROR_RATE = 0.25
+
+# Upstream calls are abandoned at this multiple of the model's p95 SLO, so a
+# stalled model fails over instead of holding the request for the SDK default
+TIMEOUT_SLO_MULTIPLE = 2.5
+
+
+@dataclass
+class ModelProfile:
+    name: str
+    p95_slo_ms: float  # Full completion
+    ttft_slo_ms: float  # Time to first streamed token
+
+    def slo_ms(self, stream: bool) -> float:
+        return self.ttft_slo_ms if stream else self.p95_slo_ms
+
+
+@dataclass
+class RouteDecision:
+    model: str
+    max_tokens: int
+    temperature: float
+    route: str
+    candidates: List[str] = field(default_factory=list)
+    reason: str = "preferred"
+
+
+MODEL_PROFILES = {
+    "fast": ModelProfile(name="llama-3.1-8b-instant", p95_slo_ms=1000, ttft_slo_ms=400),
+    "default": ModelProfile(name="llama3-8b-8192", p95_slo_ms=2000, ttft_slo_ms=700),
+    "quality": ModelProfile(
+        name="llama-3.3-70b-versatile", p95_slo_ms=4000, ttft_slo_ms=1500
+    ),
+}
+
+# route -> (preferred model order, max_tokens, temperature)
+ROUTES = {
+    "check_in": (["fast", "default", "quality"], 256, 0.7),
+    "conversation": (["default", "fast", "quality"], 1024, 0.7),
+    "distress": (["quality", "default", "fast"], 1024, 0.5),
+}
+
+
+class ModelStats:
+    """Rolling latency and error samples for one model"""
+
+    def __init__(self):
+        self.samples: Deque[Tuple[float, float, bool]] = deque(
+            maxlen=STATS_MAX_SAMPLES
+        )
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        self.samples.append((time.monotonic(), latency_ms, ok))
+
+    def _recent(self) -> List[Tuple[float, float, bool]]:
+        cutoff = time.monotonic() - STATS_WINDOW_SECONDS
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+        return list(self.samples)
+
+    def summary(self) -> dict:
+        recent = self._recent()
+        latencies = sorted(latency for _, latency, ok in recent if ok)
+        errors = sum(1 for _, _, ok in recent if not ok)
+        # Nearest rank, so a single slow sample in a small window still counts
+        p95 = latencies[math.ceil(len(latencies) * 0.95) - 1] if latencies else None
+        return {
+            "samples": len(recent),
+            "p95_ms": round(p95, 1) if p95 is not None else None,
+            "error_rate": round(errors / len(recent), 3) if recent else 0.0,
+        }
+
+
+class ModelRouter:
+    """Routes requests across GROQ models by message shape and model health"""
+
+    def __init__(self, profiles: Optional[Dict[str, ModelProfile]] = None):
+        self.profiles = profiles or MODEL_PROFILES
+        # Completion latency and time to first token, per model
+        self.stats: Dict[str, ModelStats] = {
+            profile.name: ModelStats() for profile in self.profiles.values()
+        }
+        self.stream_stats: Dict[str, ModelStats] = {
+            profile.name: ModelStats() for profile in self.profiles.values()
+        }
+        self._lock = threading.Lock()
+
+    def _stats_for(self, stream: bool) -> Dict[str, ModelStats]:
+        return self.stream_stats if stream else self.stats
+
+    def route(
+        self, message: str, risk_level: str = "low", stream: bool = False
+    ) -> RouteDecision:
+        """Pick the model and generation limits for a message"""
+        if risk_level == "medium":
+            route = "distress"
+        elif len(message) <= SHORT_MESSAGE_CHARS:
+            route = "check_in"
+        else:
+            route = "conversation"
+
+        tiers, max_tokens, temperature = ROUTES[route]
+        candidates = [self.profiles[tier].name for tier in tiers]
+
+        ordered, reason = self._order_by_health(candidates, stream)
+        decision = RouteDecision(
+            model=ordered[0],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            route=route,
+            candidates=ordered,
+            reason=reason,
+        )
+        logger.info(
+            "model route=%s model=%s max_tokens=%d stream=%s reason=%s",
+            route,
+            decision.model,
+            max_tokens,
+            stream,
+            reason,
+        )
+        return decision
+
+    def timeout_for(self, model: str, stream: bool = False) -> float:
+        """Per-call upstream timeout in seconds for a model
+
+        For streams this bounds the wait for each chunk, the first included.
+        """
+        slos = [
+            profile.slo_ms(stream)
+            for profile in self.profiles.values()
+            if profile.name == model
+        ] or [profile.slo_ms(stream) for profile in self.profiles.values()]
+        return max(slos) * TIMEOUT_SLO_MULTIPLE / 1000
+
+    def record(self, model: str, latency_ms: float, ok: bool, stream: bool = False) -> None:
+        """Record the outcome of a request (time to first token for streams)"""
+        with self._lock:
+            self._stats_for(stream).setdefault(model, ModelStats()).record(latency_ms, ok)
+        logger.info(
+            "model outcome model=%s latency_ms=%.1f ok=%s stream=%s",
+            model,
+            latency_ms,
+            ok,
+            stream,
+        )
+
+    def snapshot(self) -> dict:
+        """Current per-model statistics and health"""
+        with self._lock:
+            models = {}
+            for profile in self.profiles.values():
+                models[profile.name] = {}
+                for kind, stream in (("completion", False), ("stream", True)):
+                    summary = self._stats_for(stream)[profile.name].summary()
+                    models[profile.name][kind] = {
+                        **summary,
+                        "slo_ms": profile.slo_ms(stream),
+                        "healthy": self._is_healthy(profile, summary, stream),
+                    }
+            return {"models": models}
+
+    def _order_by_health(
+        self, candidates: List[str], stream: bool = False
+    ) -> Tuple[List[str], str]:
+        """Healthy models in preference order, followed by degraded ones"""
+        with self._lock:
+            stats = self._stats_for(stream)
+            summaries = {name: stats[name].summary() for name in candidates}
+        profiles = {profile.name: profile for profile in self.profiles.values()}
+
+        healthy = [
+            name
+            for name in candidates
+            if self._is_healthy(profiles[name], summaries[name], stream)
+        ]
+        if healthy:
+            degraded = [name for name in candidates if name not in healthy]
+            reason = "preferred" if healthy[0] == candidates[0] else "failover"
+            return healthy + degraded, reason
+
+        # Everything is degraded: fall back to whichever is currently fastest
+        def p95_or_inf(name: str) -> float:
+            p95 = summaries[name]["p95_ms"]
+            return p95 if p95 is not None else float("inf")
+
+        return sorted(candidates, key=p95_or_inf), "all_degraded"
+
+    @staticmethod
+    def _is_healthy(profile: ModelProfile, summary: dict, stream: bool = False) -> bool:
+        if summary["samples"] < MIN_SAMPLES:
+            return True
+        if summary["error_rate"] > MAX_ERROR_RATE:
+            return False
+        p95 = summary["p95_ms"]
+        return p95 is None or p95 <= profile.slo_ms(stream)
@@ -35,14 +35,19 @@ class RiskClassifier:
             r"\b(treatment plan)\b",
         ]
 
+        # Compiled once per process; analyze() runs on every chat message
+        self._high_risk = [re.compile(p) for p in self.high_risk_patterns]
+        self._medium_risk = [re.compile(p) for p in self.medium_risk_patterns]
+        self._redirect = [re.compile(p) for p in self.redirect_patterns]
+
     def analyze(self, message: str) -> Dict:
         """Analyze a message for risk level"""
         message_lower = message.lower()
         concerns: List[str] = []
 
         # Check high-risk patterns
-        for pattern in self.high_risk_patterns:
-            if re.search(pattern, message_lower):
+        for pattern in self._high_risk:
+            if pattern.search(message_lower):
                 concerns.append(f"High-risk content detected")
                 return {
                     "risk_level": "high",
@@ -52,8 +57,8 @@ class RiskClassifier:
                 }
 
         # Check medium-risk patterns
-        for pattern in self.medium_risk_patterns:
-            if re.search(pattern, message_lower):
+        for pattern in self._medium_risk:
+            if pattern.search(message_lower):
                 concerns.append("Potential distress indicators")
 
         if concerns:
@@ -65,8 +70,8 @@ class RiskClassifier:
             }
 
         # Check redirect patterns
-        for pattern in self.redirect_patterns:
-            if re.search(pattern, message_lower):
+        for pattern in self._redirect:
+            if pattern.search(message_lower):
                 return {
                     "risk_level": "low",
                     "concerns": ["Medical topic detected"],
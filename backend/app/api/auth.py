@@ -1,6 +1,7 @@
 """
 Authentication API endpoints
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, EmailStr
 from app.core.security import (
@@ -48,7 +49,15 @@ async def register(user: UserRegister):
             detail="Email already registered",
         )
 
-    hashed_password = get_password_hash(user.password)
+    # bcrypt is deliberately slow, so keep it off the event loop
+    hashed_password = await asyncio.to_thread(get_password_hash, user.password)
+    # Check again: another registration for this email may have finished
+    # while the hash was computed
+    if user.email in fake_users_db:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered",
+        )
     fake_users_db[user.email] = {
         "email": user.email,
         "hashed_password": hashed_password,
@@ -74,7 +83,9 @@ async def login(user: UserLogin):
             detail="Invalid email or password",
         )
 
-    if not verify_password(user.password, db_user["hashed_password"]):
+    if not await asyncio.to_thread(
+        verify_password, user.password, db_user["hashed_password"]
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -1,17 +1,45 @@
 """
 AI Chat API endpoints
 """
-from fastapi import APIRouter, HTTPException
+import asyncio
+import json
+from functools import lru_cache
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
 from pydantic import BaseModel
 from typing import List, Optional
 from app.ai.groq_client import GroqClient
 from app.ai.prompt_engine import PromptEngine
 from app.ai.risk_classifier import RiskClassifier
+from app.core.admission import admission_controller
+from app.core.chat_sessions import ChatSession, chat_sessions
+from app.core.config import settings
+from app.core.mood_store import mood_store
+from app.core.security import get_optional_user, get_user_from_token
 
 router = APIRouter()
-groq_client = GroqClient()
-prompt_engine = PromptEngine()
-risk_classifier = RiskClassifier()
+
+
+# Built on first use (or during warmup) rather than at import time
+@lru_cache(maxsize=None)
+def get_groq_client() -> GroqClient:
+    return GroqClient()
+
+
+@lru_cache(maxsize=None)
+def get_prompt_engine() -> PromptEngine:
+    return PromptEngine()
+
+
+@lru_cache(maxsize=None)
+def get_risk_classifier() -> RiskClassifier:
+    return RiskClassifier()
 
 
 class ChatMessage(BaseModel):
@@ -42,31 +70,38 @@ class SafetyCheckResponse(BaseModel):
 
 
 @router.post("/send", response_model=ChatResponse)
-async def send_message(request: ChatRequest):
+async def send_message(
+    request: ChatRequest, user_id: Optional[str] = Depends(get_optional_user)
+):
     """Send a message to the AI companion"""
     try:
         # Check for safety concerns
-        risk_result = risk_classifier.analyze(request.message)
+        risk_result = get_risk_classifier().analyze(request.message)
         
         if risk_result["risk_level"] == "high":
             # Return safety response instead
             return ChatResponse(
-                message=prompt_engine.get_safety_response(risk_result),
+                message=get_prompt_engine().get_safety_response(risk_result),
                 session_id=request.session_id,
                 safety_flag="escalation_detected",
             )
 
+        # Prompt engine and client work with plain dicts, as on the socket path
+        context = [msg.model_dump() for msg in request.context or []]
+
         # Build prompt with context
-        system_prompt = prompt_engine.build_prompt(
-            context=request.context or [],
+        system_prompt = get_prompt_engine().build_prompt(
+            context=context,
             risk_level=risk_result["risk_level"],
+            user_mood=mood_store.latest_mood(user_id),
         )
 
         # Get AI response
-        response = await groq_client.chat(
+        response = await get_groq_client().chat(
             message=request.message,
             system_prompt=system_prompt,
-            context=request.context or [],
+            context=context,
+            risk_level=risk_result["risk_level"],
         )
 
         return ChatResponse(
@@ -82,7 +117,7 @@ async def send_message(request: ChatRequest):
 @router.post("/safety-check", response_model=SafetyCheckResponse)
 async def safety_check(request: SafetyCheckRequest):
     """Check a message for safety concerns"""
-    result = risk_classifier.analyze(request.message)
+    result = get_risk_classifier().analyze(request.message)
     return SafetyCheckResponse(
         is_safe=result["risk_level"] == "low",
         risk_level=result["risk_level"],
@@ -95,3 +130,177 @@ async def get_context(session_id: str, limit: int = 10):
     """Get conversation context for a session"""
     # TODO: Implement actual context retrieval from database
     return {"session_id": session_id, "messages": [], "limit": limit}
+
+
+@router.get("/routing")
+async def get_routing_stats():
+    """Get live per-model latency, error rate and health (debug only)"""
+    if not settings.DEBUG:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return get_groq_client().router.snapshot()
+
+
+# Seconds a client has to send its auth frame when no Authorization header is set
+WS_AUTH_TIMEOUT_SECONDS = 10
+
+
+async def _receive_frame(websocket: WebSocket, timeout: float) -> Optional[dict]:
+    """Next JSON object frame (text or UTF-8 bytes), or None if it isn't one"""
+    message = await asyncio.wait_for(websocket.receive(), timeout=timeout)
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+
+    raw = message.get("text")
+    if raw is None and message.get("bytes") is not None:
+        raw = message["bytes"]
+    try:
+        data = json.loads(raw) if raw is not None else None
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+@router.websocket("/ws")
+async def chat_socket(
+    websocket: WebSocket,
+    session_id: Optional[str] = None,
+    last_seq: int = 0,
+):
+    """Persistent chat channel, authenticated once per connection
+
+    Authenticate with an `Authorization: Bearer` header, or, for clients that
+    can't set headers, with an auth frame sent first. Tokens are never taken
+    from the URL, which would put them in access logs.
+
+    Resuming with `session_id` requires reaching the worker that holds the
+    session (see app.core.chat_sessions); elsewhere `resumed` is false.
+
+    Client frames:
+      {"type": "auth", "token": "..."}       first frame when there's no header
+      {"type": "message", "content": "..."}  send the next user message
+      {"type": "ping"}                       heartbeat, answered with "pong"
+
+    Server frames:
+      {"type": "ready", "session_id", "seq", "resumed"}
+      {"type": "delta", "content"}           partial reply while streaming
+      {"type": "done", "seq", "message", "safety_flag"}
+      {"type": "error", "detail"}
+    """
+    await websocket.accept()
+
+    try:
+        token = None
+        authorization = websocket.headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            token = authorization[7:]
+        else:
+            try:
+                frame = await _receive_frame(websocket, WS_AUTH_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                frame = None
+            if frame and frame.get("type") == "auth":
+                token = frame.get("token")
+
+        user_id = get_user_from_token(token)
+        if not user_id:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+    except (WebSocketDisconnect, RuntimeError):
+        return
+
+    session = chat_sessions.open(user_id, session_id)
+    resumed = session.session_id == session_id
+
+    try:
+        await websocket.send_json(
+            {
+                "type": "ready",
+                "session_id": session.session_id,
+                "seq": session.seq,
+                "resumed": resumed,
+            }
+        )
+
+        # Replay replies the client missed while disconnected
+        if resumed:
+            for event in session.events_after(last_seq):
+                await websocket.send_json(event)
+
+        while True:
+            try:
+                data = await _receive_frame(
+                    websocket, settings.WS_HEARTBEAT_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                await websocket.close(code=status.WS_1001_GOING_AWAY)
+                return
+
+            session.touch()
+            frame_type = data.get("type") if data else None
+
+            if frame_type == "ping":
+                await websocket.send_json({"type": "pong"})
+            elif frame_type == "message" and isinstance(data.get("content"), str):
+                # Each turn counts against admission like a POST /send would
+                if not admission_controller.try_acquire("high"):
+                    await websocket.send_json(
+                        {"type": "error", "detail": "Server is busy, please retry shortly"}
+                    )
+                    continue
+                try:
+                    await _stream_reply(websocket, session, user_id, data["content"])
+                finally:
+                    admission_controller.release()
+            else:
+                await websocket.send_json(
+                    {"type": "error", "detail": "Unsupported frame"}
+                )
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        session.touch()
+
+
+async def _stream_reply(
+    websocket: WebSocket, session: ChatSession, user_id: str, message: str
+):
+    """Run one chat turn on a socket, streaming the reply as it arrives"""
+    context = list(session.context)
+    session.add_message("user", message)
+
+    risk_result = get_risk_classifier().analyze(message)
+
+    if risk_result["risk_level"] == "high":
+        reply = get_prompt_engine().get_safety_response(risk_result)
+        safety_flag = "escalation_detected"
+    else:
+        system_prompt = get_prompt_engine().build_prompt(
+            context=context,
+            risk_level=risk_result["risk_level"],
+            user_mood=mood_store.latest_mood(user_id),
+        )
+
+        parts = []
+        connected = True
+        async for delta in get_groq_client().stream_chat(
+            message=message,
+            system_prompt=system_prompt,
+            context=context,
+            risk_level=risk_result["risk_level"],
+        ):
+            parts.append(delta)
+            if not connected:
+                continue
+            try:
+                await websocket.send_json({"type": "delta", "content": delta})
+            except (WebSocketDisconnect, RuntimeError):
+                # Finish the reply anyway so a reconnecting client can replay it
+                connected = False
+        reply = "".join(parts)
+        safety_flag = risk_result.get("flag")
+
+    session.add_message("assistant", reply)
+    event = session.record_event(
+        {"type": "done", "message": reply, "safety_flag": safety_flag}
+    )
+    await websocket.send_json(event)
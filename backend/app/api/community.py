@@ -1,9 +1,10 @@
 """
 Community API endpoints
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
+from app.api.sections import section_response
 
 router = APIRouter()
 
@@ -19,37 +20,16 @@ class CommunityPost(BaseModel):
     created_at: str
 
 
-# Sample data
-SAMPLE_POSTS = [
-    CommunityPost(
-        id="p1",
-        author_name="Anonymous User",
-        content="Today I practiced gratitude for 5 minutes. Small wins matter! 🌱",
-        likes_count=24,
-        comments_count=3,
-        created_at="2024-01-15T10:30:00Z",
-    ),
-    CommunityPost(
-        id="p2",
-        author_name="Wellness Warrior",
-        content="Completed my first week of daily meditation. The journey begins!",
-        likes_count=42,
-        comments_count=8,
-        created_at="2024-01-14T15:45:00Z",
-    ),
-]
-
-
 @router.get("/posts", response_model=List[CommunityPost])
 async def get_posts(limit: int = 20, offset: int = 0):
     """Get community posts (read-only in v1)"""
-    return SAMPLE_POSTS[offset : offset + limit]
+    return section_response("posts", offset, offset + limit)
 
 
 @router.get("/posts/{post_id}", response_model=CommunityPost)
 async def get_post(post_id: str):
     """Get a specific post by ID"""
-    for post in SAMPLE_POSTS:
-        if post.id == post_id:
-            return post
-    return {"error": "Post not found"}
+    response = section_response(f"posts/{post_id}")
+    if response is None:
+        raise HTTPException(status_code=404, detail="Post not found")
+    return response
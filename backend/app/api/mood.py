@@ -0,0 +1,67 @@
+"""
+Mood Check-in API endpoints
+"""
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from app.core.mood_store import MAX_SCORE, MIN_SCORE, mood_store
+from app.core.security import get_current_user
+
+router = APIRouter()
+
+
+class MoodCheckIn(BaseModel):
+    score: int = Field(..., ge=MIN_SCORE, le=MAX_SCORE)
+    timestamp: Optional[float] = None  # Unix seconds, defaults to now
+
+
+class MoodCheckInResponse(BaseModel):
+    timestamp: float
+    current_mood: Optional[str] = None
+
+
+class RollingAveragePoint(BaseModel):
+    date: str
+    average: float
+
+
+class MoodSummary(BaseModel):
+    current_mood: Optional[str] = None
+    trend: Optional[float] = None  # Score points per day
+    streak_days: int = 0
+    rolling_average: List[RollingAveragePoint] = []
+
+
+@router.post("/check-in", response_model=MoodCheckInResponse)
+async def check_in(request: MoodCheckIn, user_id: str = Depends(get_current_user)):
+    """Record a mood check-in"""
+    try:
+        # Takes a file lock and writes (or rewrites) the column files
+        timestamp = await asyncio.to_thread(
+            mood_store.check_in, user_id, request.score, request.timestamp
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return MoodCheckInResponse(
+        timestamp=timestamp,
+        current_mood=mood_store.latest_mood(user_id),
+    )
+
+
+@router.get("/summary", response_model=MoodSummary)
+async def get_summary(
+    days: int = Query(30, ge=1, le=366),
+    window_days: int = Query(7, ge=1, le=90),
+    user_id: str = Depends(get_current_user),
+):
+    """Get the current mood, trend, streak and rolling average"""
+    return MoodSummary(
+        current_mood=mood_store.latest_mood(user_id),
+        trend=mood_store.trend(user_id, days=min(days, 14)),
+        streak_days=mood_store.streak(user_id),
+        rolling_average=mood_store.rolling_average(
+            user_id, window_days=window_days, days=days
+        ),
+    )
@@ -1,9 +1,10 @@
 """
 Resources API endpoints
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
+from app.api.sections import section_response
 
 router = APIRouter()
 
@@ -19,75 +20,40 @@ class Resource(BaseModel):
     duration_minutes: Optional[int] = None
 
 
-# Sample data
-SAMPLE_ARTICLES = [
-    Resource(
-        id="1",
-        type="article",
-        title="Understanding Anxiety: A Beginner's Guide",
-        description="Learn about the basics of anxiety and how to manage it.",
-        category="Mental Health",
-        author="Dr. Sarah Johnson",
-    ),
-    Resource(
-        id="2",
-        type="article",
-        title="The Power of Mindful Breathing",
-        description="Discover how breathing exercises can reduce stress.",
-        category="Mindfulness",
-        author="Michael Chen",
-    ),
-]
+def _list_resources(collection: str, category: Optional[str], limit: int):
+    """Serve a resource list from the shared snapshot"""
+    if category:
+        response = section_response(f"{collection}?category={category.lower()}")
+        return response if response is not None else []
+    return section_response(collection, stop=limit)
+
 
-SAMPLE_COURSES = [
-    Resource(
-        id="c1",
-        type="course",
-        title="7-Day Meditation Challenge",
-        description="Start your mindfulness journey with this beginner course.",
-        category="Meditation",
-        duration_minutes=70,
-    ),
-    Resource(
-        id="c2",
-        type="course",
-        title="Sleep Better Tonight",
-        description="Improve your sleep quality with proven techniques.",
-        category="Sleep",
-        duration_minutes=45,
-    ),
-]
+def _get_resource(collection: str, resource_id: str, not_found: str):
+    response = section_response(f"{collection}/{resource_id}")
+    if response is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    return response
 
 
 @router.get("/articles", response_model=List[Resource])
 async def get_articles(category: Optional[str] = None, limit: int = 20):
     """Get articles, optionally filtered by category"""
-    if category:
-        return [a for a in SAMPLE_ARTICLES if a.category.lower() == category.lower()]
-    return SAMPLE_ARTICLES[:limit]
+    return _list_resources("articles", category, limit)
 
 
 @router.get("/articles/{article_id}", response_model=Resource)
 async def get_article(article_id: str):
     """Get a specific article by ID"""
-    for article in SAMPLE_ARTICLES:
-        if article.id == article_id:
-            return article
-    return {"error": "Article not found"}
+    return _get_resource("articles", article_id, "Article not found")
 
 
 @router.get("/courses", response_model=List[Resource])
 async def get_courses(category: Optional[str] = None, limit: int = 20):
     """Get courses, optionally filtered by category"""
-    if category:
-        return [c for c in SAMPLE_COURSES if c.category.lower() == category.lower()]
-    return SAMPLE_COURSES[:limit]
+    return _list_resources("courses", category, limit)
 
 
 @router.get("/courses/{course_id}", response_model=Resource)
 async def get_course(course_id: str):
     """Get a specific course by ID"""
-    for course in SAMPLE_COURSES:
-        if course.id == course_id:
-            return course
-    return {"error": "Course not found"}
+    return _get_resource("courses", course_id, "Course not found")
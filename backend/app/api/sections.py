@@ -0,0 +1,22 @@
+"""
+Snapshot section responses
+"""
+from typing import Optional
+from fastapi import Response
+from app.core.snapshot import shared_snapshot
+
+
+def section_response(
+    name: str, start: int = 0, stop: Optional[int] = None
+) -> Optional[Response]:
+    """Serve a section's pre-serialized JSON as-is, or None if it is missing
+
+    With `start`/`stop`, serve only that slice of a list section.
+    """
+    if start == 0 and stop is None:
+        raw = shared_snapshot.get(name)
+    else:
+        raw = shared_snapshot.get_items(name, start, stop)
+    if raw is None:
+        return None
+    return Response(content=bytes(raw), media_type="application/json")
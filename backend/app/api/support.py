@@ -4,6 +4,7 @@ Support API endpoints
 from fastapi import APIRouter
 from pydantic import BaseModel, EmailStr
 from typing import Optional
+from app.api.sections import section_response
 
 router = APIRouter()
 
@@ -45,19 +46,4 @@ async def submit_feedback(request: FeedbackRequest):
 @router.get("/faq")
 async def get_faq():
     """Get frequently asked questions"""
-    return {
-        "faqs": [
-            {
-                "question": "What is BurrowMind?",
-                "answer": "BurrowMind is your personal AI-assisted mental wellness companion, designed for reflection, self-awareness, and emotional regulation.",
-            },
-            {
-                "question": "Is my data private?",
-                "answer": "Yes! Your data is stored locally on your device. We prioritize your privacy and do not share personal information.",
-            },
-            {
-                "question": "Is the AI a therapist?",
-                "answer": "No. BurrowMind's AI is designed for reflection and self-awareness, not therapy or medical advice. If you're in crisis, please contact a mental health professional.",
-            },
-        ]
-    }
+    return section_response("faq")
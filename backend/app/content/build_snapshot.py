@@ -0,0 +1,59 @@
+"""
+Snapshot Builder
+
+Builds the shared read-only snapshot from the content catalog, and publishes
+it for running workers to pick up:
+
+    python -m app.content.build_snapshot [path]
+"""
+import sys
+from typing import Any, Dict, List
+
+from app.api.community import CommunityPost
+from app.api.resources import Resource
+from app.content import catalog
+from app.core.config import settings
+from app.core.snapshot import publish_snapshot
+
+
+def _add_collection(
+    sections: Dict[str, Any], name: str, items: List[dict], by_category: bool
+) -> None:
+    """Add a list section plus per-item (and per-category) sections"""
+    sections[name] = items
+    for item in items:
+        sections[f"{name}/{item['id']}"] = item
+
+    if by_category:
+        for item in items:
+            key = f"{name}?category={item['category'].lower()}"
+            sections.setdefault(key, []).append(item)
+
+
+def build_sections() -> Dict[str, Any]:
+    """Collect every snapshot section, validated through the API models"""
+    sections: Dict[str, Any] = {}
+
+    # Dump through the response models so the bytes match what they'd return
+    articles = [Resource(**a).model_dump() for a in catalog.ARTICLES]
+    courses = [Resource(**c).model_dump() for c in catalog.COURSES]
+    posts = [CommunityPost(**p).model_dump() for p in catalog.POSTS]
+
+    _add_collection(sections, "articles", articles, by_category=True)
+    _add_collection(sections, "courses", courses, by_category=True)
+    _add_collection(sections, "posts", posts, by_category=False)
+    sections["faq"] = {"faqs": catalog.FAQS}
+
+    return sections
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else settings.SNAPSHOT_PATH
+    if not path:
+        sys.exit("No snapshot path given and SNAPSHOT_PATH is not set")
+    version = publish_snapshot(path, build_sections())
+    print(f"Published snapshot version {version} to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Read-only content served by the API
+
+Loaded by the snapshot builder, and by any worker running without a
+published snapshot (`SharedSnapshot._build_in_process`, the default until
+`python -m app.content.build_snapshot` is run). Workers serving a published
+snapshot never import it.
+"""
+
+# Sample data
+ARTICLES = [
+    {
+        "id": "1",
+        "type": "article",
+        "title": "Understanding Anxiety: A Beginner's Guide",
+        "description": "Learn about the basics of anxiety and how to manage it.",
+        "category": "Mental Health",
+        "author": "Dr. Sarah Johnson",
+    },
+    {
+        "id": "2",
+        "type": "article",
+        "title": "The Power of Mindful Breathing",
+        "description": "Discover how breathing exercises can reduce stress.",
+        "category": "Mindfulness",
+        "author": "Michael Chen",
+    },
+]
+
+COURSES = [
+    {
+        "id": "c1",
+        "type": "course",
+        "title": "7-Day Meditation Challenge",
+        "description": "Start your mindfulness journey with this beginner course.",
+        "category": "Meditation",
+        "duration_minutes": 70,
+    },
+    {
+        "id": "c2",
+        "type": "course",
+        "title": "Sleep Better Tonight",
+        "description": "Improve your sleep quality with proven techniques.",
+        "category": "Sleep",
+        "duration_minutes": 45,
+    },
+]
+
+POSTS = [
+    {
+        "id": "p1",
+        "author_name": "Anonymous User",
+        "content": "Today I practiced gratitude for 5 minutes. Small wins matter! 🌱",
+        "likes_count": 24,
+        "comments_count": 3,
+        "created_at": "2024-01-15T10:30:00Z",
+    },
+    {
+        "id": "p2",
+        "author_name": "Wellness Warrior",
+        "content": "Completed my first week of daily meditation. The journey begins!",
+        "likes_count": 42,
+        "comments_count": 8,
+        "created_at": "2024-01-14T15:45:00Z",
+    },
+]
+
+FAQS = [
+    {
+        "question": "What is BurrowMind?",
+        "answer": "BurrowMind is your personal AI-assisted mental wellness companion, designed for reflection, self-awareness, and emotional regulation.",
+    },
+    {
+        "question": "Is my data private?",
+        "answer": "Yes! Your data is stored locally on your device. We prioritize your privacy and do not share personal information.",
+    },
+    {
+        "question": "Is the AI a therapist?",
+        "answer": "No. BurrowMind's AI is designed for reflection and self-awareness, not therapy or medical advice. If you're in crisis, please contact a mental health professional.",
+    },
+]
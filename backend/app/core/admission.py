@@ -0,0 +1,200 @@
+"""
+Adaptive Admission Control
+
+Measures event-loop lag, adjusts the allowed concurrency with AIMD (additive
+increase, multiplicative decrease) and sheds low-priority routes first when
+the worker is saturated. Request latency is deliberately not a signal: chat
+requests spend seconds waiting on GROQ with the loop idle, which is not load.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LAG_SAMPLE_INTERVAL_SECONDS = 0.1
+LAG_EWMA_WEIGHT = 0.3
+
+# Fraction of the concurrency limit each priority may occupy. Lower
+# priorities are refused earlier, leaving headroom for chat and safety checks.
+PRIORITY_SHARE = {
+    "low": 0.5,
+    "normal": 0.8,
+    "high": 1.0,
+}
+
+# Longest matching path prefix decides the priority
+ROUTE_PRIORITIES = {
+    "/api/v1/chat/safety-check": "high",
+    "/api/v1/chat": "high",
+    "/api/v1/auth": "normal",
+    "/api/v1/mood": "normal",
+    "/api/v1/support": "normal",
+    "/api/v1/community": "low",
+    "/api/v1/resources": "low",
+}
+
+# Never shed, so probes and the load balancer always get an answer
+EXEMPT_PATHS = {"/", "/health", "/health/live"}
+
+
+def route_priority(path: str) -> str:
+    for prefix in sorted(ROUTE_PRIORITIES, key=len, reverse=True):
+        if path.startswith(prefix):
+            return ROUTE_PRIORITIES[prefix]
+    return "normal"
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop wakes up from a short sleep"""
+
+    def __init__(self, interval: float = LAG_SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (time.perf_counter() - started - self.interval) * 1000)
+            self.lag_ms += LAG_EWMA_WEIGHT * (lag_ms - self.lag_ms)
+
+
+class AdmissionController:
+    """AIMD concurrency limit driven by event-loop lag"""
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        max_loop_lag_ms: float,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self.in_flight = 0
+        self.shed_count = 0
+        self.lag_monitor = LoopLagMonitor()
+        self._last_decrease = 0.0
+
+    @property
+    def overloaded(self) -> bool:
+        # A full limit alone only means requests are waiting on upstream
+        return self.lag_monitor.lag_ms > self.max_loop_lag_ms
+
+    def try_acquire(self, priority: str) -> bool:
+        """Admit a request if its priority's share of the limit is not used up"""
+        if self.lag_monitor.lag_ms > self.max_loop_lag_ms:
+            # The loop is already behind: back off before admitting more work
+            self._decrease()
+        allowed = max(1, int(self.limit * PRIORITY_SHARE[priority]))
+        if self.in_flight >= allowed:
+            self.shed_count += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        # Only a limit that was actually reached is evidence it can grow;
+        # otherwise light traffic would ratchet it up to the maximum
+        at_limit = self.in_flight >= int(self.limit)
+        self.in_flight -= 1
+        if self.lag_monitor.lag_ms > self.max_loop_lag_ms:
+            self._decrease()
+        elif at_limit:
+            # Grows the limit by roughly one per limit's worth of good requests
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _decrease(self) -> None:
+        # At most one cut per lag-sample interval, so one burst isn't punished twice
+        now = time.monotonic()
+        if now - self._last_decrease < LAG_SAMPLE_INTERVAL_SECONDS:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self.limit = max(self.min_limit, self.limit * 0.9)
+        if int(previous) != int(self.limit):
+            logger.info(
+                "concurrency limit lowered to %d (lag=%.1fms in_flight=%d)",
+                int(self.limit),
+                self.lag_monitor.lag_ms,
+                self.in_flight,
+            )
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "loop_lag_ms": round(self.lag_monitor.lag_ms, 1),
+            "shed_total": self.shed_count,
+        }
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that sheds HTTP requests the controller won't admit
+
+    WebSocket connections pass through; the chat socket admits each turn
+    itself, since one connection carries many requests.
+    """
+
+    def __init__(self, app, controller: "AdmissionController"):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        if not self.controller.try_acquire(route_priority(scope["path"])):
+            await self._reject(send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
+
+    @staticmethod
+    async def _reject(send) -> None:
+        body = json.dumps({"detail": "Server is busy, please retry shortly"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", b"1"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+admission_controller = AdmissionController(
+    initial_limit=settings.ADMISSION_INITIAL_LIMIT,
+    min_limit=settings.ADMISSION_MIN_LIMIT,
+    max_limit=settings.ADMISSION_MAX_LIMIT,
+    max_loop_lag_ms=settings.ADMISSION_MAX_LOOP_LAG_MS,
+)
@@ -0,0 +1,111 @@
+"""
+Chat Session Store
+
+Server-side state for persistent chat connections, so clients only send new
+messages and can resume a conversation after reconnecting.
+
+Sessions live in the memory of the worker process that opened them. A
+reconnect only resumes if it reaches the same worker, so multi-worker
+deployments need sticky routing on session_id (for example a proxy in front
+of per-worker ports). Otherwise the client is told `resumed: false` and
+starts a new session without context.
+"""
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from app.core.config import settings
+
+MAX_CONTEXT_MESSAGES = 20
+MAX_REPLAY_EVENTS = 20
+
+# Upper bound on how often expired sessions are swept
+SWEEP_INTERVAL_SECONDS = 60
+
+
+class ChatSession:
+    """Conversation state shared by every connection of one session"""
+
+    def __init__(self, session_id: str, user_id: str):
+        self.session_id = session_id
+        self.user_id = user_id
+        self.context: Deque[dict] = deque(maxlen=MAX_CONTEXT_MESSAGES)
+        # Completed replies kept for clients that reconnect mid-stream
+        self.events: Deque[dict] = deque(maxlen=MAX_REPLAY_EVENTS)
+        self.seq = 0
+        self.last_seen = time.monotonic()
+
+    def add_message(self, role: str, content: str) -> None:
+        self.context.append({"role": role, "content": content})
+
+    def record_event(self, event: dict) -> dict:
+        """Assign the next sequence number to an event and keep it for replay"""
+        self.seq += 1
+        event = {**event, "seq": self.seq}
+        self.events.append(event)
+        return event
+
+    def events_after(self, last_seq: int) -> List[dict]:
+        return [event for event in self.events if event["seq"] > last_seq]
+
+    def touch(self) -> None:
+        self.last_seen = time.monotonic()
+
+
+class ChatSessionStore:
+    """In-memory session registry with idle expiry"""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._sessions: Dict[str, ChatSession] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Expire idle sessions periodically, even without new connections"""
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def stop(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(min(SWEEP_INTERVAL_SECONDS, self.ttl_seconds))
+            self._evict_expired()
+
+    def open(self, user_id: str, session_id: Optional[str] = None) -> ChatSession:
+        """Resume a session owned by the user, or start a new one"""
+        self._evict_expired()
+
+        session = self._sessions.get(session_id) if session_id else None
+        if session is None or session.user_id != user_id:
+            # Never resume another user's session, even if the id collides
+            session = ChatSession(uuid.uuid4().hex, user_id)
+            self._sessions[session.session_id] = session
+
+        session.touch()
+        return session
+
+    def _evict_expired(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [
+            session_id
+            for session_id, session in self._sessions.items()
+            if session.last_seen < cutoff
+        ]
+        for session_id in expired:
+            del self._sessions[session_id]
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+chat_sessions = ChatSessionStore(settings.CHAT_SESSION_TTL_SECONDS)
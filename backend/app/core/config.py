@@ -22,6 +22,27 @@ class Settings(BaseSettings):
 
     # GROQ AI
     GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
+    GROQ_BASE_URL: str = os.getenv("GROQ_BASE_URL", "")  # Empty uses the GROQ API
+
+    # Chat WebSocket
+    WS_HEARTBEAT_TIMEOUT_SECONDS: int = int(os.getenv("WS_HEARTBEAT_TIMEOUT_SECONDS", 60))
+    CHAT_SESSION_TTL_SECONDS: int = int(os.getenv("CHAT_SESSION_TTL_SECONDS", 900))
+
+    # Admission control
+    ADMISSION_INITIAL_LIMIT: int = int(os.getenv("ADMISSION_INITIAL_LIMIT", 64))
+    ADMISSION_MIN_LIMIT: int = int(os.getenv("ADMISSION_MIN_LIMIT", 4))
+    ADMISSION_MAX_LIMIT: int = int(os.getenv("ADMISSION_MAX_LIMIT", 512))
+    ADMISSION_MAX_LOOP_LAG_MS: float = float(os.getenv("ADMISSION_MAX_LOOP_LAG_MS", 50))
+
+    # Shared read-only snapshot (empty builds the data in each worker)
+    SNAPSHOT_PATH: str = os.getenv("SNAPSHOT_PATH", "data/snapshot.bin")
+
+    # Startup warmup (run before the worker accepts requests)
+    WARMUP_ENABLED: bool = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+    WARMUP_TIMEOUT_SECONDS: float = float(os.getenv("WARMUP_TIMEOUT_SECONDS", 10))
+
+    # Mood tracking (empty keeps check-ins in memory only)
+    MOOD_DATA_DIR: str = os.getenv("MOOD_DATA_DIR", "data/mood")
 
     class Config:
         case_sensitive = True
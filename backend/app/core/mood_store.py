@@ -0,0 +1,369 @@
+"""
+Mood Time-Series Store
+
+Per-user mood check-ins kept as two parallel columns (timestamps and scores)
+in compact `array` buffers. Every append is written through to a pair of
+column files on disk, which are memory-mapped back in when a user's series is
+first loaded, and again whenever another worker has changed them. Writers
+hold an exclusive `flock` on a per-user lock file.
+"""
+import hashlib
+import math
+import mmap
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, run a single worker
+    fcntl = None
+
+SECONDS_PER_DAY = 86400
+
+MIN_SCORE = 1
+MAX_SCORE = 5
+
+# Accepted check-in timestamps: a little client clock skew into the future,
+# and backfilled entries up to a month old
+MAX_CLOCK_SKEW_SECONDS = 300
+MAX_BACKFILL_SECONDS = 30 * SECONDS_PER_DAY
+
+# Older check-ins no longer describe the user's current mood
+CURRENT_MOOD_MAX_AGE_SECONDS = 3 * SECONDS_PER_DAY
+
+# Series kept in memory per worker; others are reloaded from disk on demand
+MAX_CACHED_SERIES = 1024
+
+# Mirrors the mood selector on the mobile app (1 = Terrible ... 5 = Excellent)
+MOOD_LABELS = {
+    1: "terrible",
+    2: "bad",
+    3: "okay",
+    4: "good",
+    5: "excellent",
+}
+
+
+def _load_column(path: str, typecode: str) -> array:
+    """Load a column file into an array through a read-only memory map"""
+    column = array(typecode)
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return column
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Ignore a torn trailing record left by an interrupted write
+            usable = len(mm) - (len(mm) % column.itemsize)
+            column.frombytes(mm[:usable])
+    return column
+
+
+def _derive_mood(series: "MoodSeries") -> str:
+    """Blend the latest check-in with the recent trend into a short label"""
+    latest = series.scores[-1]
+    label = MOOD_LABELS[min(MAX_SCORE, max(MIN_SCORE, int(round(latest))))]
+
+    # Compare against the previous three days to describe direction
+    start, end = series.window(series.timestamps[-1] - 3 * SECONDS_PER_DAY)
+    if end - start >= 3:
+        recent = series.scores[start : end - 1]
+        baseline = sum(recent) / len(recent)
+        if latest - baseline >= 1:
+            return f"{label} (improving)"
+        if baseline - latest >= 1:
+            return f"{label} (declining)"
+    return label
+
+
+class _FileLock:
+    """Advisory lock on a file shared by every worker on the host"""
+
+    def __init__(self, path: str, exclusive: bool):
+        self.path = path
+        self.exclusive = exclusive
+        self._file = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._file = open(self.path, "a")
+            fcntl.flock(
+                self._file.fileno(), fcntl.LOCK_EX if self.exclusive else fcntl.LOCK_SH
+            )
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+class MoodSeries:
+    """Columnar mood history for a single user"""
+
+    def __init__(self, path_prefix: Optional[str] = None):
+        self.path_prefix = path_prefix
+        self.timestamps = array("d")
+        self.scores = array("f")
+        self.signature: Optional[tuple] = None
+        # Derived on every load/append, so prompt building is a plain lookup
+        self.latest_label: Optional[str] = None
+
+        if path_prefix and os.path.exists(f"{path_prefix}.ts"):
+            with self._file_lock(exclusive=False):
+                self._load()
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def _file_lock(self, exclusive: bool):
+        return _FileLock(f"{self.path_prefix}.lock", exclusive)
+
+    def _disk_signature(self) -> Optional[tuple]:
+        """Size and mtime of both column files, to detect writes by other workers"""
+        signature = []
+        for suffix in ("ts", "score"):
+            try:
+                stat = os.stat(f"{self.path_prefix}.{suffix}")
+            except FileNotFoundError:
+                return None
+            signature.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        return tuple(signature)
+
+    def is_stale(self) -> bool:
+        return bool(self.path_prefix) and self._disk_signature() != self.signature
+
+    def refresh(self) -> None:
+        """Reload from disk if another worker changed the files"""
+        if self.is_stale():
+            with self._file_lock(exclusive=False):
+                self._load()
+
+    def _load(self) -> None:
+        timestamps = _load_column(f"{self.path_prefix}.ts", "d")
+        scores = _load_column(f"{self.path_prefix}.score", "f")
+        # Keep both columns the same length after a partial write
+        size = min(len(timestamps), len(scores))
+        del timestamps[size:]
+        del scores[size:]
+
+        self.timestamps = timestamps
+        self.scores = scores
+        self.signature = self._disk_signature()
+        self.latest_label = _derive_mood(self) if len(timestamps) else None
+
+    def append(self, timestamp: float, score: float) -> None:
+        """Append a check-in, keeping the series sorted by timestamp"""
+        if not self.path_prefix:
+            self._insert(timestamp, score)
+            return
+
+        # Created on first write, so importing the store touches no files
+        os.makedirs(os.path.dirname(self.path_prefix) or ".", exist_ok=True)
+        with self._file_lock(exclusive=True):
+            # Pick up other workers' check-ins before writing, so a rewrite
+            # never drops them and appends stay in timestamp order
+            if self.is_stale():
+                self._load()
+            if self._insert(timestamp, score):
+                self._rewrite()
+            else:
+                with open(f"{self.path_prefix}.ts", "ab") as f:
+                    array("d", [timestamp]).tofile(f)
+                with open(f"{self.path_prefix}.score", "ab") as f:
+                    array("f", [score]).tofile(f)
+            self.signature = self._disk_signature()
+
+    def _insert(self, timestamp: float, score: float) -> bool:
+        """Add a check-in in memory; True if it landed before the last entry"""
+        late = bool(self.timestamps) and timestamp < self.timestamps[-1]
+        if late:
+            # Late arrivals are rare, so an in-place insert is acceptable
+            index = bisect_left(self.timestamps, timestamp)
+            self.timestamps.insert(index, timestamp)
+            self.scores.insert(index, score)
+        else:
+            self.timestamps.append(timestamp)
+            self.scores.append(score)
+        self.latest_label = _derive_mood(self)
+        return late
+
+    def _rewrite(self) -> None:
+        """Rewrite both column files from memory"""
+        for suffix, column in (("ts", self.timestamps), ("score", self.scores)):
+            tmp_path = f"{self.path_prefix}.{suffix}.tmp"
+            with open(tmp_path, "wb") as f:
+                column.tofile(f)
+            os.replace(tmp_path, f"{self.path_prefix}.{suffix}")
+
+    def window(self, since: float) -> Tuple[int, int]:
+        """Index range [start, end) of check-ins at or after `since`"""
+        return bisect_left(self.timestamps, since), len(self.timestamps)
+
+    def daily_means(self, since: float) -> List[Tuple[int, float]]:
+        """Average score per UTC day as (day_number, mean) pairs"""
+        start, end = self.window(since)
+        days: List[Tuple[int, float]] = []
+        current_day = None
+        total = 0.0
+        count = 0
+        for i in range(start, end):
+            day = int(self.timestamps[i] // SECONDS_PER_DAY)
+            if day != current_day:
+                if count:
+                    days.append((current_day, total / count))
+                current_day, total, count = day, 0.0, 0
+            total += self.scores[i]
+            count += 1
+        if count:
+            days.append((current_day, total / count))
+        return days
+
+
+class MoodStore:
+    """Per-user mood series with cached latest mood for prompt building
+
+    With a data directory, only the most recently used series are kept in
+    memory; the rest are reloaded from their column files when next needed.
+    """
+
+    def __init__(self, data_dir: Optional[str] = None):
+        self.data_dir = data_dir
+        self._series: "OrderedDict[str, MoodSeries]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path_prefix(self, user_id: str) -> Optional[str]:
+        if not self.data_dir:
+            return None
+        # Emails are not safe file names, and should not be visible on disk
+        digest = hashlib.sha256(user_id.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.data_dir, digest)
+
+    def _get_series(self, user_id: str) -> MoodSeries:
+        """The user's series, reloaded if another worker has written to it"""
+        with self._lock:
+            series = self._series.get(user_id)
+            if series is None:
+                series = MoodSeries(self._path_prefix(user_id))
+                self._series[user_id] = series
+                # Without a data directory memory is the only copy, so keep it
+                if self.data_dir and len(self._series) > MAX_CACHED_SERIES:
+                    self._series.popitem(last=False)
+                return series
+
+            self._series.move_to_end(user_id)
+            series.refresh()
+            return series
+
+    def check_in(
+        self, user_id: str, score: float, timestamp: Optional[float] = None
+    ) -> float:
+        """Record a mood check-in and return its timestamp"""
+        if not MIN_SCORE <= score <= MAX_SCORE:
+            raise ValueError(f"Mood score must be between {MIN_SCORE} and {MAX_SCORE}")
+
+        now = time.time()
+        if timestamp is None:
+            timestamp = now
+        elif not math.isfinite(timestamp):
+            raise ValueError("Timestamp must be a finite number")
+        elif timestamp > now + MAX_CLOCK_SKEW_SECONDS:
+            raise ValueError("Timestamp cannot be in the future")
+        elif timestamp < now - MAX_BACKFILL_SECONDS:
+            raise ValueError(
+                f"Timestamp cannot be more than {MAX_BACKFILL_SECONDS // SECONDS_PER_DAY} days old"
+            )
+
+        series = self._get_series(user_id)
+        with self._lock:
+            series.append(timestamp, score)
+        return timestamp
+
+    def latest_mood(self, user_id: Optional[str]) -> Optional[str]:
+        """Derived mood from recent check-ins, or None if there are none"""
+        if not user_id:
+            return None
+        series = self._get_series(user_id)
+        if not len(series):
+            return None
+        if series.timestamps[-1] < time.time() - CURRENT_MOOD_MAX_AGE_SECONDS:
+            return None
+        return series.latest_label
+
+    def rolling_average(
+        self, user_id: str, window_days: int = 7, days: int = 30
+    ) -> List[dict]:
+        """Rolling average of daily mean scores over the last `days` days"""
+        series = self._get_series(user_id)
+        daily = series.daily_means(time.time() - days * SECONDS_PER_DAY)
+        if not daily:
+            return []
+
+        # Prefix sums make each window an O(1) lookup
+        prefix = list(accumulate((mean for _, mean in daily), initial=0.0))
+        day_numbers = [day for day, _ in daily]
+        points = []
+        for i, day in enumerate(day_numbers):
+            start = bisect_left(day_numbers, day - window_days + 1)
+            average = (prefix[i + 1] - prefix[start]) / (i + 1 - start)
+            points.append(
+                {
+                    "date": time.strftime(
+                        "%Y-%m-%d", time.gmtime(day * SECONDS_PER_DAY)
+                    ),
+                    "average": round(average, 2),
+                }
+            )
+        return points
+
+    def trend(self, user_id: str, days: int = 14) -> Optional[float]:
+        """Least-squares slope of the daily mean score in points per day, or None"""
+        series = self._get_series(user_id)
+        # Fit over days, not check-ins, so a few check-ins an hour apart
+        # don't read as a huge swing per day
+        daily = series.daily_means(time.time() - days * SECONDS_PER_DAY)
+        n = len(daily)
+        if n < 2:
+            return None
+
+        xs = [day for day, _ in daily]
+        ys = [mean for _, mean in daily]
+        mean_x = math.fsum(xs) / n
+        mean_y = math.fsum(ys) / n
+        var_x = math.fsum((x - mean_x) ** 2 for x in xs)
+        if var_x == 0:
+            return None
+        cov = math.fsum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+        return round(cov / var_x, 4)
+
+    def streak(self, user_id: str) -> int:
+        """Number of consecutive days with a check-in, ending today or yesterday"""
+        series = self._get_series(user_id)
+        if not len(series):
+            return 0
+
+        today = int(time.time() // SECONDS_PER_DAY)
+        expected = int(series.timestamps[-1] // SECONDS_PER_DAY)
+        if expected < today - 1:
+            return 0
+
+        streak = 0
+        for i in range(len(series) - 1, -1, -1):
+            day = int(series.timestamps[i] // SECONDS_PER_DAY)
+            if day == expected:
+                streak += 1
+                expected -= 1
+            elif day < expected:
+                break
+        return streak
+
+
+mood_store = MoodStore(settings.MOOD_DATA_DIR or None)
@@ -0,0 +1,217 @@
+"""
+Shared Read-Only Snapshot
+
+Read-mostly data (resource catalog, community posts, FAQ) is built once into
+a versioned snapshot file of pre-serialized JSON sections. Every worker
+memory-maps the same file, so the pages are shared through the OS page cache
+instead of each worker holding its own copy.
+
+File layout:
+    MAGIC | header length (u32, little endian) | header JSON | section bytes
+
+List sections also record where each item starts, so a page of items can be
+served by slicing bytes instead of decoding the whole list.
+
+Publishing writes a new file and atomically renames it over the old one.
+Workers notice the new inode and swap to it without restarting, after
+checking the body against the header's sha256; an invalid file is ignored and
+the previous version kept.
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from itertools import accumulate
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"BMSNAP1\n"
+_HEADER_LENGTH = struct.Struct("<I")
+
+# How often a worker checks whether a newer snapshot was published
+CHECK_INTERVAL_SECONDS = 1.0
+
+
+def encode_snapshot(sections: Dict[str, Any], version: Optional[int] = None) -> bytes:
+    """Serialize sections into the snapshot file format"""
+    if version is None:
+        version = time.time_ns()
+
+    blobs = {}
+    # list section -> offset of each item within the section, plus its length
+    item_offsets = {}
+    for name, value in sections.items():
+        if isinstance(value, list):
+            items = [_dumps(item) for item in value]
+            blob = b"[" + b",".join(items) + b"]"
+            starts = list(accumulate((len(item) + 1 for item in items), initial=1))
+            item_offsets[name] = starts
+        else:
+            blob = _dumps(value)
+        blobs[name] = blob
+
+    index = {}
+    offset = 0
+    for name, blob in blobs.items():
+        count = len(sections[name]) if isinstance(sections[name], list) else None
+        index[name] = [offset, len(blob), count]
+        offset += len(blob)
+    body = b"".join(blobs.values())
+
+    header = json.dumps(
+        {
+            "version": version,
+            "sha256": hashlib.sha256(body).hexdigest(),
+            "sections": index,
+            "items": item_offsets,
+        },
+        separators=(",", ":"),
+    ).encode()
+    return MAGIC + _HEADER_LENGTH.pack(len(header)) + header + body
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def publish_snapshot(path: str, sections: Dict[str, Any]) -> int:
+    """Write a new snapshot and atomically replace the published one"""
+    data = encode_snapshot(sections)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return _parse_header(data)[0]["version"]
+
+
+def _parse_header(buffer) -> tuple:
+    if bytes(buffer[: len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a BurrowMind snapshot")
+    start = len(MAGIC)
+    (header_length,) = _HEADER_LENGTH.unpack_from(buffer, start)
+    start += _HEADER_LENGTH.size
+    header = json.loads(bytes(buffer[start : start + header_length]))
+    return header, start + header_length
+
+
+class _SnapshotView:
+    """Sections of one snapshot version, backed by a memory map or bytes"""
+
+    def __init__(self, buffer, inode: Optional[int] = None):
+        self.buffer = buffer
+        self.inode = inode
+        header, self.body_offset = _parse_header(buffer)
+        with memoryview(buffer) as view, view[self.body_offset :] as body:
+            digest = hashlib.sha256(body).hexdigest()
+        if digest != header["sha256"]:
+            raise ValueError("Snapshot body does not match its sha256")
+        self.version = header["version"]
+        self.sections = header["sections"]
+        self.items = header["items"]
+
+    def get(self, name: str) -> Optional[memoryview]:
+        entry = self.sections.get(name)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        start = self.body_offset + offset
+        return memoryview(self.buffer)[start : start + length]
+
+    def get_items(self, name: str, start: int, stop: int) -> Optional[bytes]:
+        """JSON array of items [start:stop] of a list section"""
+        raw = self.get(name)
+        starts = self.items.get(name)
+        if raw is None or starts is None:
+            return None
+        start, stop, _ = slice(start, stop).indices(len(starts) - 1)
+        if stop <= start:
+            return b"[]"
+        # Items end one byte before the next one starts (a comma, or "]")
+        return b"[" + bytes(raw[starts[start] : starts[stop] - 1]) + b"]"
+
+
+class SharedSnapshot:
+    """Memory-mapped snapshot that follows atomic republishes"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._view: Optional[_SnapshotView] = None
+        # Inode of a published file that failed to load, so it isn't retried
+        self._rejected_inode: Optional[int] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._current().version
+
+    def get(self, name: str) -> Optional[memoryview]:
+        """Raw JSON bytes of a section, without copying"""
+        return self._current().get(name)
+
+    def get_items(self, name: str, start: int, stop: int) -> Optional[bytes]:
+        """JSON bytes of a page of a list section, without decoding it"""
+        return self._current().get_items(name, start, stop)
+
+    def _current(self) -> _SnapshotView:
+        now = time.monotonic()
+        if self._view is not None and now < self._next_check:
+            return self._view
+
+        with self._lock:
+            if self._view is None or now >= self._next_check:
+                self._next_check = now + CHECK_INTERVAL_SECONDS
+                self._view = self._open() or self._view or self._build_in_process()
+        return self._view
+
+    def _open(self) -> Optional[_SnapshotView]:
+        """Map the published file if it changed since the last check"""
+        if not self.path:
+            return None
+        try:
+            inode = os.stat(self.path).st_ino
+            if inode == self._rejected_inode or (
+                self._view is not None and self._view.inode == inode
+            ):
+                return None
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return None
+
+        with f:
+            # Take the inode from the open file in case of a concurrent publish
+            inode = os.fstat(f.fileno()).st_ino
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # The previous map is released once in-flight responses drop their views
+            return _SnapshotView(mapped, inode=inode)
+        except (ValueError, KeyError, struct.error) as e:
+            # Keep serving the previous (or in-process) data
+            logger.warning("Ignoring invalid snapshot %s: %s", self.path, e)
+            self._rejected_inode = inode
+            mapped.close()
+            return None
+
+    @staticmethod
+    def _build_in_process() -> _SnapshotView:
+        """Fallback when no snapshot has been published yet"""
+        from app.content.build_snapshot import build_sections
+
+        return _SnapshotView(encode_snapshot(build_sections()))
+
+
+shared_snapshot = SharedSnapshot(settings.SNAPSHOT_PATH or None)
+
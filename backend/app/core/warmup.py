@@ -0,0 +1,79 @@
+"""
+Worker Warmup
+
+Heavy subsystems are created lazily on first use. When warmup is enabled, the
+lifespan runs these steps before the worker starts accepting requests, so the
+first user request doesn't pay for imports, pattern compilation or opening
+upstream connections.
+"""
+import asyncio
+import logging
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _load_snapshot() -> None:
+    from app.core.snapshot import shared_snapshot
+
+    shared_snapshot.version
+
+
+def _prepare_classifier() -> None:
+    from app.api.chat import get_prompt_engine, get_risk_classifier
+
+    get_risk_classifier().analyze("warmup")
+    get_prompt_engine()
+
+
+def _prepare_security() -> None:
+    from app.core.security import decode_token, get_password_hash
+
+    # Loads the bcrypt backend (passlib self-tests it on first use) and jose
+    get_password_hash("warmup")
+    decode_token("warmup")
+
+
+async def _open_upstream() -> None:
+    from app.api.chat import get_groq_client
+
+    await get_groq_client().warmup()
+
+
+async def _run_steps() -> None:
+    steps = [
+        ("snapshot", lambda: asyncio.to_thread(_load_snapshot)),
+        ("classifier", lambda: asyncio.to_thread(_prepare_classifier)),
+        ("security", lambda: asyncio.to_thread(_prepare_security)),
+        ("upstream", _open_upstream),
+    ]
+    for name, step in steps:
+        started = time.perf_counter()
+        try:
+            await step()
+        except Exception:
+            # Warmup is best effort: the subsystem still initializes on first use
+            logger.warning("warmup step %s failed", name, exc_info=True)
+            continue
+        logger.info(
+            "warmup step %s took %.1fms", name, (time.perf_counter() - started) * 1000
+        )
+
+
+async def warmup() -> None:
+    """Initialize heavy subsystems ahead of the first request"""
+    if not settings.WARMUP_ENABLED:
+        return
+
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(_run_steps(), timeout=settings.WARMUP_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "warmup did not finish within %ss, continuing startup",
+            settings.WARMUP_TIMEOUT_SECONDS,
+        )
+        return
+    logger.info("warmup finished in %.1fms", (time.perf_counter() - started) * 1000)
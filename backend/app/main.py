@@ -2,10 +2,27 @@
 BurrowMind Backend - FastAPI Application
 AI-Assisted Mental Wellness Companion
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import auth, chat, resources, community, support
+from fastapi.responses import JSONResponse
+from app.api import auth, chat, mood, resources, community, support
+from app.core.admission import AdmissionMiddleware, admission_controller
+from app.core.chat_sessions import chat_sessions
 from app.core.config import settings
+from app.core.warmup import warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Heavy subsystems are lazy; warm them before accepting traffic
+    await warmup()
+    admission_controller.lag_monitor.start()
+    chat_sessions.start()
+    yield
+    await chat_sessions.stop()
+    await admission_controller.lag_monitor.stop()
+
 
 app = FastAPI(
     title="BurrowMind API",
@@ -13,6 +30,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -24,9 +42,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Admission control (added last so it runs first and sheds before any work)
+app.add_middleware(AdmissionMiddleware, controller=admission_controller)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(chat.router, prefix="/api/v1/chat", tags=["AI Chat"])
+app.include_router(mood.router, prefix="/api/v1/mood", tags=["Mood"])
 app.include_router(resources.router, prefix="/api/v1/resources", tags=["Resources"])
 app.include_router(community.router, prefix="/api/v1/community", tags=["Community"])
 app.include_router(support.router, prefix="/api/v1/support", tags=["Support"])
@@ -43,4 +65,18 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    """Readiness: 503 while the worker is overloaded so it can be drained"""
+    overloaded = admission_controller.overloaded
+    return JSONResponse(
+        status_code=503 if overloaded else 200,
+        content={
+            "status": "overloaded" if overloaded else "healthy",
+            **admission_controller.snapshot(),
+        },
+    )
+
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness: the process is up and serving requests"""
+    return {"status": "alive"}
@@ -0,0 +1,170 @@
+"""
+Chat transport benchmark
+
+Compares per-turn overhead of POST /api/v1/chat/send against the persistent
+WebSocket channel. Then it opens idle WebSocket connections until the worker
+refuses more or the target count is reached, keeps them alive with pings for
+--hold seconds, and counts how many are still open.
+
+Run against a single worker with no GROQ_API_KEY set, so the AI call returns
+immediately and only transport overhead is measured:
+
+    uvicorn app.main:app --workers 1
+    python -m benchmarks.chat_ws_bench --url http://localhost:8000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+
+import httpx
+import websockets
+
+# Well inside the server's default 60s WS_HEARTBEAT_TIMEOUT_SECONDS
+HEARTBEAT_INTERVAL_SECONDS = 20
+
+
+async def get_token(client: httpx.AsyncClient) -> str:
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            "password": "benchmark-password",
+            "display_name": "Benchmark",
+        },
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def summarize(name: str, samples: list) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{name:<10} turns={len(samples)} "
+        f"mean={statistics.mean(samples) * 1000:.2f}ms "
+        f"p50={statistics.median(samples) * 1000:.2f}ms "
+        f"p95={p95 * 1000:.2f}ms"
+    )
+
+
+async def bench_http(client: httpx.AsyncClient, token: str, turns: int) -> list:
+    headers = {"Authorization": f"Bearer {token}"}
+    context = []
+    samples = []
+    for i in range(turns):
+        message = f"Turn {i}: a short check-in about my day"
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/v1/chat/send",
+            headers=headers,
+            json={"message": message, "session_id": "bench", "context": context},
+        )
+        response.raise_for_status()
+        samples.append(time.perf_counter() - started)
+        context = (
+            context
+            + [
+                {"role": "user", "content": message},
+                {"role": "assistant", "content": response.json()["message"]},
+            ]
+        )[-10:]
+    return samples
+
+
+async def connect(ws_url: str, token: str):
+    """Open a chat socket, authenticate with an auth frame and wait for ready"""
+    ws = await websockets.connect(f"{ws_url}/api/v1/chat/ws")
+    await ws.send(json.dumps({"type": "auth", "token": token}))
+    json.loads(await ws.recv())  # ready
+    return ws
+
+
+async def bench_websocket(ws_url: str, token: str, turns: int) -> list:
+    samples = []
+    ws = await connect(ws_url, token)
+    try:
+        for i in range(turns):
+            started = time.perf_counter()
+            await ws.send(
+                json.dumps(
+                    {"type": "message", "content": f"Turn {i}: a short check-in about my day"}
+                )
+            )
+            while json.loads(await ws.recv())["type"] != "done":
+                pass
+            samples.append(time.perf_counter() - started)
+    finally:
+        await ws.close()
+    return samples
+
+
+async def heartbeat(connections: list) -> None:
+    """Keep idle sockets inside the server's heartbeat timeout"""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+        for ws in list(connections):
+            try:
+                await ws.send(json.dumps({"type": "ping"}))
+                await ws.recv()  # pong
+            except websockets.WebSocketException:
+                pass
+
+
+async def still_open(ws) -> bool:
+    try:
+        await ws.send(json.dumps({"type": "ping"}))
+        return json.loads(await asyncio.wait_for(ws.recv(), 10))["type"] == "pong"
+    except (asyncio.TimeoutError, websockets.WebSocketException):
+        return False
+
+
+async def bench_idle(ws_url: str, token: str, target: int, hold: float) -> int:
+    connections = []
+    pinger = asyncio.create_task(heartbeat(connections))
+    try:
+        for _ in range(target):
+            try:
+                connections.append(await connect(ws_url, token))
+            except (OSError, websockets.WebSocketException) as e:
+                print(f"stopped opening connections: {e}")
+                break
+
+        # Hold past the server's idle timeout, then count the live ones
+        await asyncio.sleep(hold)
+        pinger.cancel()
+        alive = await asyncio.gather(*(still_open(ws) for ws in connections))
+        return sum(alive)
+    finally:
+        pinger.cancel()
+        await asyncio.gather(
+            *(ws.close() for ws in connections), return_exceptions=True
+        )
+
+
+async def main(url: str, turns: int, idle: int, hold: float) -> None:
+    ws_url = url.replace("http", "ws", 1)
+    async with httpx.AsyncClient(base_url=url) as client:
+        token = await get_token(client)
+        summarize("http", await bench_http(client, token, turns))
+
+    summarize("websocket", await bench_websocket(ws_url, token, turns))
+
+    started = time.perf_counter()
+    held = await bench_idle(ws_url, token, idle, hold)
+    print(
+        f"idle       held {held}/{idle} connections "
+        f"for {hold:.0f}s ({time.perf_counter() - started:.1f}s total)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--idle", type=int, default=5000)
+    parser.add_argument("--hold", type=float, default=75.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.turns, args.idle, args.hold))
@@ -0,0 +1,138 @@
+"""
+Cold-start benchmark
+
+1. Import-time profile of `app.main` (via `python -X importtime`), listing the
+   slowest top-level imports.
+2. Time to first successful request: starts a single uvicorn worker and polls
+   POST /api/v1/chat/safety-check until it succeeds, with warmup on and off.
+   Then compares the first and second registration, which load bcrypt and
+   jose on first use when warmup is off.
+
+    python -m benchmarks.cold_start_bench --runs 5
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+PROBE_PATH = "/api/v1/chat/safety-check"
+PROBE_BODY = {"message": "I had a long day at work"}
+REGISTER_PATH = "/api/v1/auth/register"
+
+
+def _register_body() -> dict:
+    return {
+        "email": f"cold-{uuid.uuid4().hex[:8]}@example.com",
+        "password": "benchmark-password",
+        "display_name": "Cold Start",
+    }
+
+
+def import_profile(top: int) -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            _, cumulative, indent, module = match.groups()
+            entries.append((len(indent), int(cumulative), module))
+
+    # Entries are printed children-first, so app.main's own imports are the
+    # entries just before it that sit one indentation level deeper
+    root = next(i for i, e in enumerate(entries) if e[2] == "app.main")
+    root_depth, total, _ = entries[root]
+    direct = []
+    for depth, cumulative, module in reversed(entries[:root]):
+        if depth <= root_depth:
+            break
+        if depth == root_depth + 2:
+            direct.append((depth, cumulative, module))
+
+    print(f"import app.main: {total / 1000:.1f}ms")
+    for _, cumulative, module in sorted(direct, key=lambda e: -e[1])[:top]:
+        print(f"  {cumulative / 1000:>8.1f}ms  {module}")
+    for heavy in ("groq", "jose", "passlib"):
+        loaded = any(module == heavy for _, _, module in entries)
+        print(f"  {heavy:<8} imported at startup: {'yes' if loaded else 'no'}")
+
+
+def _timed_post(url: str, body: dict) -> float:
+    # A fresh connection per request, so every sample pays the same TCP cost
+    started = time.perf_counter()
+    httpx.post(url, json=body).raise_for_status()
+    return time.perf_counter() - started
+
+
+def time_to_first_request(port: int, warmup: bool) -> tuple:
+    """(time to first ok, first registration latency, second registration latency)"""
+    env = {**os.environ, "WARMUP_ENABLED": "true" if warmup else "false"}
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    try:
+        while True:
+            try:
+                _timed_post(base_url + PROBE_PATH, PROBE_BODY)
+                break
+            except httpx.HTTPError:
+                pass
+            if time.perf_counter() - started > 60:
+                raise RuntimeError("server did not become ready")
+            time.sleep(0.01)
+        ready = time.perf_counter() - started
+
+        # Registration exercises bcrypt and jose, the lazily loaded subsystems
+        first = _timed_post(base_url + REGISTER_PATH, _register_body())
+        second = _timed_post(base_url + REGISTER_PATH, _register_body())
+        return ready, first, second
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    import_profile(args.top)
+    print()
+    print(f"{'warmup':<7} {'first ok (median)':>18} {'1st register':>13} {'2nd register':>13}")
+    for warmup in (False, True):
+        runs = [time_to_first_request(args.port, warmup) for _ in range(args.runs)]
+        print(
+            f"{'on' if warmup else 'off':<7} "
+            f"{statistics.median(r[0] for r in runs) * 1000:>16.0f}ms "
+            f"{statistics.median(r[1] for r in runs) * 1000:>11.1f}ms "
+            f"{statistics.median(r[2] for r in runs) * 1000:>11.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Fake multi-model GROQ server
+
+Serves the OpenAI-compatible chat completions endpoint used by the GROQ SDK,
+with configurable latency and error rate per model, so model routing and
+failover can be exercised locally:
+
+    python -m benchmarks.fake_groq_server --port 9000 \\
+        --model llama-3.1-8b-instant:300:0.0 \\
+        --model llama3-8b-8192:800:0.0 \\
+        --model llama-3.3-70b-versatile:2500:0.1
+
+    GROQ_API_KEY=fake GROQ_BASE_URL=http://localhost:9000 uvicorn app.main:app
+
+Latency can be changed while running, e.g. to push a model past its SLO:
+
+    curl -X POST "localhost:9000/admin/models/llama-3.1-8b-instant?latency_ms=3000"
+
+Live routing statistics are available at GET /api/v1/chat/routing in DEBUG.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+app = FastAPI(title="Fake GROQ")
+
+# model name -> {"latency_ms": float, "error_rate": float}
+MODELS: dict = {}
+
+
+def _completion_text(request_body: dict) -> str:
+    words = ["I", "hear", "you.", "Tell", "me", "more", "about", "that."]
+    limit = max(1, min(len(words), request_body.get("max_tokens", 1024)))
+    return " ".join(words[:limit])
+
+
+@app.post("/openai/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    model = body.get("model")
+    config = MODELS.get(model)
+    if config is None:
+        raise HTTPException(status_code=404, detail=f"Unknown model {model}")
+
+    # Jitter latency by +/-20% so percentiles are meaningful
+    await asyncio.sleep(config["latency_ms"] * random.uniform(0.8, 1.2) / 1000)
+    if random.random() < config["error_rate"]:
+        raise HTTPException(status_code=503, detail="Injected failure")
+
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    created = int(time.time())
+    text = _completion_text(body)
+
+    if body.get("stream"):
+
+        async def events():
+            for word in text.split(" "):
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": {"role": "assistant", "content": word + " "},
+                            "finish_reason": None,
+                        }
+                    ],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": created,
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+@app.get("/openai/v1/models")
+async def list_models():
+    # Used by the worker warmup to open its connection pool
+    return {
+        "object": "list",
+        "data": [
+            {"id": name, "object": "model", "created": 0, "owned_by": "fake"}
+            for name in MODELS
+        ],
+    }
+
+
+@app.post("/admin/models/{model}")
+async def configure_model(
+    model: str, latency_ms: float = None, error_rate: float = None
+):
+    config = MODELS.setdefault(model, {"latency_ms": 100.0, "error_rate": 0.0})
+    if latency_ms is not None:
+        config["latency_ms"] = latency_ms
+    if error_rate is not None:
+        config["error_rate"] = error_rate
+    return {model: config}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake multi-model GROQ server")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument(
+        "--model",
+        action="append",
+        default=[],
+        help="name:latency_ms:error_rate (repeatable)",
+    )
+    args = parser.parse_args()
+
+    for spec in args.model or [
+        "llama-3.1-8b-instant:300:0.0",
+        "llama3-8b-8192:800:0.0",
+        "llama-3.3-70b-versatile:2500:0.0",
+    ]:
+        name, latency_ms, error_rate = spec.rsplit(":", 2)
+        MODELS[name] = {"latency_ms": float(latency_ms), "error_rate": float(error_rate)}
+
+    uvicorn.run(app, port=args.port)
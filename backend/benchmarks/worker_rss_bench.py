@@ -0,0 +1,141 @@
+"""
+Per-worker memory benchmark
+
+Starts uvicorn with N workers, once building read-only data in every worker
+and once reading a published shared snapshot. It warms the catalog and FAQ
+endpoints, then reports RSS and PSS per worker from /proc (Linux only).
+PSS splits shared pages between the processes that map them, so it shows
+what sharing the snapshot saves.
+
+    python -m benchmarks.worker_rss_bench --workers 8 16
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+WARM_PATHS = [
+    "/api/v1/resources/articles",
+    "/api/v1/resources/courses?category=sleep",
+    "/api/v1/community/posts",
+    "/api/v1/support/faq",
+]
+
+
+def read_memory_kb(pid: int) -> tuple:
+    """(rss, pss) in kB for a process"""
+    rss = pss = 0
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Rss:"):
+                rss = int(line.split()[1])
+            elif line.startswith("Pss:"):
+                pss = int(line.split()[1])
+    return rss, pss
+
+
+def child_pids(pid: int) -> list:
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, so split after it
+                parent = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+        if parent == pid:
+            children.append(int(entry))
+    return children
+
+
+def worker_pids(supervisor: int, workers: int) -> list:
+    # Skip the multiprocessing resource tracker that may share the parent
+    pids = []
+    for pid in child_pids(supervisor):
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            if b"resource_tracker" not in f.read():
+                pids.append(pid)
+    return pids[:workers]
+
+
+def measure(workers: int, port: int, snapshot_path: str) -> dict:
+    env = {**os.environ, "SNAPSHOT_PATH": snapshot_path, "DEBUG": "false"}
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    try:
+        url = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                if httpx.get(f"{url}/health/live").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("server did not start")
+            time.sleep(0.2)
+
+        # Spread enough requests that every worker serves each path
+        with httpx.Client(base_url=url) as client:
+            for _ in range(workers * 10):
+                for path in WARM_PATHS:
+                    client.get(path)
+        time.sleep(1)
+
+        samples = [read_memory_kb(pid) for pid in worker_pids(server.pid, workers)]
+        return {
+            "workers": len(samples),
+            "rss_kb": sum(rss for rss, _ in samples) / len(samples),
+            "pss_kb": sum(pss for _, pss in samples) / len(samples),
+        }
+    finally:
+        server.send_signal(signal.SIGINT)
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[8, 16])
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = os.path.join(tmp, "snapshot.bin")
+        subprocess.run(
+            [sys.executable, "-m", "app.content.build_snapshot", snapshot_path],
+            check=True,
+        )
+
+        print(f"{'workers':>7} {'mode':<10} {'rss/worker':>12} {'pss/worker':>12}")
+        for workers in args.workers:
+            for mode, path in (("per-worker", ""), ("snapshot", snapshot_path)):
+                result = measure(workers, args.port, path)
+                print(
+                    f"{result['workers']:>7} {mode:<10} "
+                    f"{result['rss_kb'] / 1024:>10.1f}MB "
+                    f"{result['pss_kb'] / 1024:>10.1f}MB"
+                )
+
+
+if __name__ == "__main__":
+    main()